@@ -8,6 +8,14 @@ setup(
     author_email='sccs@soracom.jp',
     description='python soracam client library',
     packages=find_packages(),
-    install_requires=['requests'],
+    install_requires=['requests', 'brotli'],
+    extras_require={
+        'orjson': ['orjson'],
+        'async': ['httpx[http2]'],
+        'test': [
+            'pytest', 'pytest-xdist', 'python-dotenv', 'filetype',
+            'responses', 'vcrpy',
+        ],
+    },
     python_requires='>=3.9',
 )
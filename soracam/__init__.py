@@ -1,3 +1,4 @@
 from .soracam_api_config import *
 from .soracam_error import *
 from .soracam_api import *
+from .soracam_async_api import *
@@ -6,19 +6,32 @@ to make authenticated requests to the API and handle the response.
 """
 
 import os
+import copy
 import logging
+import posixpath
+import random
+import shutil
+import threading
 import time
-from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import unquote, urlparse
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
 import soracam as sc
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-_DEBUG = os.environ.get("DEBUG", "True").lower() in ["true", "1"]
+
+_DEBUG = os.environ.get("DEBUG", "True").lower() in {"true", "1", "yes"}
 
 # log settings
-FORMAT = "%(levelname)s %(asctime)s \
-          %(funcName)s %(filename)s %(lineno)d %(message)s"
+FORMAT = "%(levelname)s %(asctime)s %(name)s %(message)s"
 logging.basicConfig(format=FORMAT)
 logger = logging.getLogger(__name__)
 if _DEBUG:
@@ -26,12 +39,283 @@ if _DEBUG:
 else:
     logger.setLevel(logging.INFO)
 
-_REQUESTS_TIMEOUT = os.environ.get("REQUESTS_TIMEOUT", sc.REQUESTS_TIMEOUT)
-_MAX_API_RETRIES = os.environ.get("MAX_API_RETRIES", sc.MAX_API_RETRIES)
+_REQUESTS_TIMEOUT = float(
+    os.environ.get("REQUESTS_TIMEOUT", sc.REQUESTS_TIMEOUT)
+)
+_MAX_API_RETRIES = int(os.environ.get("MAX_API_RETRIES", sc.MAX_API_RETRIES))
 _SORACOM_ENDPOINT = os.environ.get("SORACOM_ENDPOINT", sc.SORACOM_ENDPOINT)
 
 
-class SoraCamClient(object):
+def _api_urls(api_endpoint: str) -> tuple:
+    """
+    Returns the auth URL and SoraCam devices base URL of an API endpoint.
+
+    The endpoint is normalized to end with a slash once, so a path in a
+    SORACOM_ENDPOINT override is kept.
+
+    Parameters:
+        api_endpoint (str): The API endpoint to make requests.
+
+    Returns:
+        tuple: The auth URL and the devices base URL without trailing slash.
+    """
+
+    api_base = api_endpoint.rstrip("/") + "/"
+    base_url = f"{api_base}{sc.SORA_CAM_BASE_URL}".rstrip("/")
+    return f"{api_base}v1/auth", base_url
+
+
+def _parse_json(response: requests.Response):
+    """
+    Decodes the JSON body of a response, with orjson if it is installed.
+
+    Raises:
+        ValueError: If the body is not valid JSON.
+    """
+
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+
+def _retry_delay(
+    attempt: int, response, retry_interval: float = sc.RETRY_INTERVAL
+) -> float:
+    """
+    Returns the wait time before retrying a rate limited request.
+
+    The delay is drawn with full jitter from an exponentially growing
+    window, but is never shorter than the Retry-After header of response.
+    Either way it is capped at RETRY_MAX_SECOND, so a large or bogus
+    Retry-After cannot block the caller indefinitely.
+
+    Parameters:
+        attempt (int): The zero-based index of the failed attempt.
+        response: The rate limited response.
+        retry_interval (float): The base interval of the window.
+
+    Returns:
+        float: The delay in seconds.
+    """
+
+    delay = random.uniform(
+        0, min(sc.RETRY_MAX_SECOND, retry_interval * 2**attempt)
+    )
+    try:
+        retry_after = float(response.headers.get("Retry-After", 0))
+    except ValueError:
+        # Retry-After given as an HTTP date
+        return delay
+    return min(max(delay, retry_after), sc.RETRY_MAX_SECOND)
+
+
+def _poll_delay(wait_time: float, deadline: float) -> float:
+    """
+    Returns the wait time before polling an export again.
+
+    Parameters:
+        wait_time (float): The current interval between polls, which the
+        caller doubles up to LOOP_WAITE_MAX_SECOND after each poll.
+        deadline (float): The time.monotonic() value polling stops at.
+
+    Returns:
+        float: The interval plus a little jitter, but never past deadline.
+    """
+
+    return max(
+        0,
+        min(
+            wait_time + random.uniform(0, sc.LOOP_WAITE_JITTER_SECOND),
+            deadline - time.monotonic(),
+        ),
+    )
+
+
+class _RetryBudget(object):
+    """
+    Tracks the retries of a single API request.
+
+    A rejected token is renewed and the request retried once without
+    counting against max_retries; rate limited requests are retried until
+    max_retries attempts have been made.
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self._attempt = 0
+        self._reauthenticated = False
+
+    def delay(self, response, headers: dict) -> float | None:
+        """
+        Returns the wait time before retrying a failed request.
+
+        Parameters:
+            response: The response with the HTTP error status.
+            headers (dict): The authentication headers sent with it.
+
+        Returns:
+            float: The delay in seconds, or None if the request must not
+            be retried.
+        """
+
+        if response.status_code == 401 and not self._reauthenticated:
+            self._client._invalidate_headers(headers)
+            self._reauthenticated = True
+            return 0
+        self._attempt += 1
+        if (
+            response.status_code != 429
+            or self._attempt >= self._client._max_retries
+        ):
+            return None
+        return _retry_delay(
+            self._attempt - 1, response, self._client._retry_interval
+        )
+
+
+class _BaseSoraCamClient(object):
+    """
+    The configuration, token cache, URLs and export status handling shared
+    by SoraCamClient and SoraCamAsyncClient, which add the transport.
+    """
+
+    def __init__(
+        self,
+        coverage_type: str,
+        auth_key_id: str,
+        auth_key: str,
+        timeout: float,
+        max_retries: int,
+        retry_interval: float,
+    ):
+        self.api_endpoint = _SORACOM_ENDPOINT % coverage_type
+        self.auth_key_id = auth_key_id
+        self.auth_key = auth_key
+        self._auth_url, self._base_url = _api_urls(self.api_endpoint)
+        self._auth_payload = {"authKeyId": auth_key_id, "authKey": auth_key}
+        self._timeout = timeout
+        self._max_retries = max_retries
+        self._retry_interval = retry_interval
+        self._cached_headers = {}
+        self._token_expiry = 0
+
+    def _valid_headers(self):
+        """
+        Returns the cached authentication headers if they can be used.
+
+        The headers are read once, so a concurrent _invalidate_headers
+        cannot turn them into an empty dict after they were checked.
+
+        Returns:
+            dict: The cached headers, or None if there are none or they
+            have expired.
+        """
+
+        headers = self._cached_headers
+        if headers and time.monotonic() < self._token_expiry:
+            return headers
+        return None
+
+    def _cache_headers(self, param: dict) -> dict:
+        """
+        Caches the API key and token returned by the auth API.
+
+        Parameters:
+            param (dict): The response of the auth API.
+
+        Returns:
+            dict: The headers to be used for authentication.
+        """
+
+        self._cached_headers = {
+            "X-Soracom-API-Key": param.get("apiKey"),
+            "X-Soracom-Token": param.get("token"),
+        }
+        self._token_expiry = time.monotonic() + sc.TOKEN_CACHE_SECOND
+        return self._cached_headers
+
+    def _invalidate_headers(self, headers: dict):
+        """
+        Discards the cached authentication headers if they are still the
+        given ones, so a token refreshed meanwhile is kept.
+
+        Parameters:
+            headers (dict): The headers rejected by the API.
+        """
+
+        if self._cached_headers is headers:
+            self._cached_headers = {}
+            self._token_expiry = 0
+
+    def _export_url(
+        self, device_id: str, media: str, export_id: str = ""
+    ) -> str:
+        """
+        Returns the URL of the export requests, or of a single export.
+
+        Parameters:
+            device_id (str): The unique identifier for the device.
+            media (str): The media type ('images' or 'videos').
+            export_id (str): The unique identifier for the export process.
+
+        Returns:
+            str: The URL of the export endpoint.
+        """
+
+        url = f"{self._base_url}/{device_id}/{media}/exports"
+        return f"{url}/{export_id}" if export_id else url
+
+    def _settings_url(self, device_id: str, setting: str = "") -> str:
+        """
+        Returns the URL of all settings of a device, or of a single one.
+
+        Parameters:
+            device_id (str): The unique identifier for the device.
+            setting (str): Specify the kind of settings. ex: `timestamp`
+
+        Returns:
+            str: The URL of the settings endpoint.
+        """
+
+        url = f"{self._base_url}/{device_id}/atomcam/settings"
+        return f"{url}/{setting}" if setting else url
+
+    @staticmethod
+    def _export_done(
+        response: dict, expected: str, device_id: str, export_id: str
+    ) -> bool:
+        """
+        Returns whether a polled export has reached the expected status.
+
+        Raises:
+            soracaom.SoraCamException.ExportFailedError: \
+                If the export process fails.
+        """
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("export status: %s", response)
+        status = response.get("status", "")
+        if status == expected:
+            return True
+        if status == "failed":
+            raise sc.ExportFailedError(
+                f"Export failed for device {device_id}, export {export_id}"
+            )
+        return False
+
+    @staticmethod
+    def _export_timeout(device_id: str, export_id: str):
+        """
+        Returns the error raised once polling an export has timed out.
+        """
+
+        return sc.ExportTimeoutError(
+            "Checking export status timed out "
+            f"for device {device_id}, export {export_id}"
+        )
+
+
+class SoraCamClient(_BaseSoraCamClient):
     """
     A client to interact with the SoraCam API.
 
@@ -40,7 +324,15 @@ class SoraCamClient(object):
         request_headers (dict): The headers to use for the requests.
     """
 
-    def __init__(self, coverage_type: str, auth_key_id: str, auth_key: str):
+    def __init__(
+        self,
+        coverage_type: str,
+        auth_key_id: str,
+        auth_key: str,
+        timeout: float = _REQUESTS_TIMEOUT,
+        max_retries: int = _MAX_API_RETRIES,
+        retry_interval: float = sc.RETRY_INTERVAL,
+    ):
         """
         Constructs all the necessary attributes for the SoraCamClient object.
 
@@ -48,75 +340,188 @@ class SoraCamClient(object):
             coverage_type (str): The type of network coverage ('jp' or 'g').
             auth_key_id (str): The authentication key ID.
             auth_key (str): The authentication key.
+            timeout (float): The timeout for API requests in seconds.
+            max_retries (int): The number of attempts per API request.
+            retry_interval (float): The base interval between attempts.
         """
 
+        super().__init__(
+            coverage_type,
+            auth_key_id,
+            auth_key,
+            timeout,
+            max_retries,
+            retry_interval,
+        )
         self.request_headers = {"Content-type": "application/json"}
-        self.api_endpoint = _SORACOM_ENDPOINT % coverage_type
-        self.auth_key_id = auth_key_id
-        self.auth_key = auth_key
+        self._session = requests.Session()
+        # the adapter retries connection errors and gateway failures only;
+        # 401 and 429 are retried by _request, so the attempts and
+        # backoff of both layers do not multiply
+        adapter = HTTPAdapter(
+            pool_connections=sc.POOL_CONNECTIONS,
+            pool_maxsize=sc.POOL_MAXSIZE,
+            max_retries=Retry(
+                total=sc.MAX_CONNECTION_RETRIES,
+                backoff_factor=sc.RETRY_BACKOFF_FACTOR,
+                status_forcelist=(500, 502, 503, 504),
+                respect_retry_after_header=False,
+                raise_on_status=False,
+            ),
+        )
+        # plain http is mounted too for SORACOM_ENDPOINT overrides,
+        # e.g. a local mock server
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update(
+            {"accept": "application/json", "Content-Type": "application/json"}
+        )
+        self._auth_lock = threading.Lock()
+        self._device_cache = {}
+        self._devices_cache = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
-    def _soracom_headers(self):
+    def close(self):
+        """
+        Closes the underlying HTTP session and releases pooled connections.
         """
-        Generate the authentication headers required for API requests.
 
-        Yields:
+        self._session.close()
+
+    def _get_headers(self) -> dict:
+        """
+        Returns the authentication headers required for API requests.
+
+        The API key and token are cached on the client and obtained from
+        the auth API only on the first call or after they have expired.
+
+        Only one thread refreshes an expired token, the others wait for it
+        and reuse the new one.
+
+        Returns:
+            dict: The headers to be used for authentication.
+        """
+
+        headers = self._valid_headers()
+        if headers:
+            return headers
+        with self._auth_lock:
+            headers = self._valid_headers()
+            if headers:
+                return headers
+            return self._authenticate()
+
+    def _authenticate(self) -> dict:
+        """
+        Obtains a new API key and token from the auth API and caches them.
+
+        Returns:
             dict: The headers to be used for authentication.
         """
 
-        url = urljoin(self.api_endpoint, "v1/auth")
-        payload = {"authKeyId": self.auth_key_id, "authKey": self.auth_key}
         try:
-            response = requests.post(
-                url=url, json=payload, timeout=_REQUESTS_TIMEOUT
+            response = self._session.post(
+                url=self._auth_url,
+                json=self._auth_payload,
+                timeout=self._timeout,
             )
+            response.raise_for_status()
         except Exception as error:
-            logger.error(f"failed to authenticate: {error}")
-            raise error
-        param = response.json()
-        headers = {
-            "X-Soracom-API-Key": param.get("apiKey"),
-            "X-Soracom-Token": param.get("token"),
-            "accept": "application/json",
-            "Content-Type": "application/json",
-        }
-        yield headers
+            logger.error("failed to authenticate: %s", error)
+            raise
+        return self._cache_headers(_parse_json(response))
 
-    def _get(
-        self, url: str, params: dict = {}, raw: bool = False
+    def _invalidate_headers(self, headers: dict):
+        """
+        Discards the cached authentication headers if they are still the
+        given ones, so a token refreshed meanwhile by another thread is kept.
+
+        Parameters:
+            headers (dict): The headers rejected by the API.
+        """
+
+        with self._auth_lock:
+            super()._invalidate_headers(headers)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: dict = None,
+        json: dict = None,
+        raw: bool = False,
     ) -> dict | requests.Response:
         """
-        Sends a GET request to URL.
+        Sends a request to URL, retrying on rate limiting and expired
+        tokens.
 
         Parameters:
-            url (str): The URL for the request send to.
-            params (dict): The path parameters
+            method (str): The HTTP method of the request.
+            url (str): The URL to send the request to.
+            params (dict): The query parameters, if any.
+            json (dict): The payload to include in the request, if any.
             raw (bool): The flag to switch return types dict or Response.
+
         Returns:
-            dict: The response from the API returned by JSON.
+            dict: The response from the API returned by JSON, or an empty
+            dict if the response has no body.
 
         Raises:
-            Exception: If an error occurs while sending the GET request.
+            requests.exceptions.HTTPError: If the API returns an error
+            status.
+            ValueError: If the response body is not valid JSON.
         """
 
-        last_exception = None
-        for _ in range(_MAX_API_RETRIES):
+        retry = _RetryBudget(self)
+        while True:
+            headers = self._get_headers()
             try:
-                response = requests.get(
-                    url=url,
-                    headers=next(self._soracom_headers()),
-                    timeout=_REQUESTS_TIMEOUT,
+                response = self._session.request(
+                    method,
+                    url,
+                    headers=headers,
                     params=params,
+                    json=json,
+                    timeout=self._timeout,
                 )
                 response.raise_for_status()
-                return response if raw else response.json()
+                if raw:
+                    return response
+                if not response.content:
+                    return {}
+                return _parse_json(response)
             except requests.exceptions.HTTPError as err:
-                logger.error(f"get request for {url} failed: {err}")
-                last_exception = err
-                if response.status_code == 429:
-                    time.sleep(sc.RETRY_INTERVAL)
-                else:
+                logger.error("%s request for %s failed: %s", method, url, err)
+                delay = retry.delay(response, headers)
+                if delay is None:
                     raise
-        raise last_exception
+                if delay:
+                    time.sleep(delay)
+
+    def _get(
+        self, url: str, params: dict = None, raw: bool = False
+    ) -> dict | requests.Response:
+        """
+        Sends a GET request to URL.
+
+        Parameters:
+            url (str): The URL for the request send to.
+            params (dict): The query parameters, if any.
+            raw (bool): The flag to switch return types dict or Response.
+        Returns:
+            dict: The response from the API returned by JSON.
+
+        Raises:
+            Exception: If an error occurs while sending the GET request.
+        """
+
+        return self._request("GET", url, params=params, raw=raw)
 
     def _post(self, url: str, payload: str) -> dict:
         """
@@ -133,28 +538,28 @@ class SoraCamClient(object):
             Exception: If an error occurs while sending the POST request.
         """
 
-        last_exception = None
-        for _ in range(_MAX_API_RETRIES):
-            try:
-                response = requests.post(
-                    url=url,
-                    headers=next(self._soracom_headers()),
-                    json=payload,
-                    timeout=_REQUESTS_TIMEOUT,
-                )
-                response.raise_for_status()
-                try:
-                    return response.json()
-                except ValueError:
-                    return {}
-            except requests.exceptions.HTTPError as err:
-                logger.error(f"post request for {url} failed: {err}")
-                last_exception = err
-                if response.status_code == 429:
-                    time.sleep(sc.RETRY_INTERVAL)
-                else:
-                    raise
-        raise last_exception
+        return self._request("POST", url, json=payload)
+
+    def _get_many(
+        self, urls: list, max_workers: int = sc.MAX_WORKERS
+    ) -> list:
+        """
+        Sends GET requests to several URLs concurrently.
+
+        Parameters:
+            urls (list): The URLs for the requests send to.
+            max_workers (int): The number of requests sent in parallel.
+
+        Returns:
+            list: The responses from the API returned by JSON, in the same
+            order as urls.
+
+        Raises:
+            Exception: If an error occurs while sending the GET requests.
+        """
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._get, urls))
 
     def _check_export_status(
         self,
@@ -162,7 +567,7 @@ class SoraCamClient(object):
         export_id: str,
         media: str,
         expected: str = "completed",
-    ) -> bool:
+    ) -> dict:
         """
         Checks the export status of a device.
 
@@ -173,7 +578,8 @@ class SoraCamClient(object):
             expected (str): The expected status of the export process.
 
         Returns:
-            bool: True if the export process is complete, False otherwise.
+            dict: The export information returned by the API once the
+            export process is complete.
 
         Raises:
             soracaom.SoraCamException.ExportFailedError: \
@@ -182,33 +588,63 @@ class SoraCamClient(object):
                 If checking the export status times out.
         """
 
-        path = os.path.join(
-            sc.SORA_CAM_BASE_URL, device_id, media, "exports", export_id
-        )
-        url = urljoin(self.api_endpoint, path)
-        start_time = time.time()
+        url = self._export_url(device_id, media, export_id)
+        deadline = time.monotonic() + sc.WAITE_TIMEOUT
         wait_time = sc.LOOP_WAITE_SECOND
-        while time.time() - start_time < sc.WAITE_TIMEOUT:
+        while time.monotonic() < deadline:
             response = self._get(url)
-            logger.debug(f"export status: {response}")
-            status = response.get("status", "")
-            if status == expected:
-                return True
-            elif status == "failed":
-                raise sc.ExportFailedError(
-                    f"Export failed for device {device_id}, \
-                    export {export_id}"
+            if self._export_done(response, expected, device_id, export_id):
+                return response
+            # poll densely at first and back off exponentially, with a
+            # little jitter, without sleeping past the deadline
+            time.sleep(_poll_delay(wait_time, deadline))
+            wait_time = min(wait_time * 2, sc.LOOP_WAITE_MAX_SECOND)
+        raise self._export_timeout(device_id, export_id)
+
+    def check_exports_bulk(
+        self,
+        exports: list,
+        media: str,
+        expected: str = "completed",
+        max_workers: int = sc.MAX_WORKERS,
+    ) -> list:
+        """
+        Checks the export status of several exports concurrently.
+
+        Parameters:
+            exports (list): The (device_id, export_id) pairs to check.
+            media (str): The media type ('images' or 'videos').
+            expected (str): The expected status of the export processes.
+            max_workers (int): The number of exports checked in parallel.
+
+        Returns:
+            list: The export information of each pair once complete, in
+            the same order as exports.
+
+        Raises:
+            soracaom.SoraCamException.ExportFailedError: \
+                If one of the export processes fails.
+            soracaom.SoraCamException.ExportTimeoutError: \
+                If checking one of the export statuses times out.
+        """
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda export: self._check_export_status(
+                        export[0], export[1], media, expected
+                    ),
+                    exports,
                 )
-            if wait_time <= sc.LOOP_WAITE_MAX_SECOND:
-                wait_time += sc.LOOP_WAITE_SECOND
-            time.sleep(wait_time)
-        raise sc.ExportTimeoutError(
-            f"Checking export status timed out \
-            for device {device_id}, export {export_id}"
-        )
+            )
 
     @staticmethod
-    def download_file_from_url(target_url: str, target_directory: str) -> str:
+    def download_file_from_url(
+        target_url: str,
+        target_directory: str | os.PathLike,
+        session: requests.Session = None,
+        timeout: float = _REQUESTS_TIMEOUT,
+    ) -> str:
         """
         Downloads a file from the specified URL and saves it to the specified
         path.
@@ -217,6 +653,9 @@ class SoraCamClient(object):
             target_url (str): The URL of the file to download.
             target_directory (str): The directory where the downloaded file
             should be saved.
+            session (requests.Session): The session to reuse connections
+            from. A one-off connection is used if omitted.
+            timeout (float): The timeout for the download request.
 
         Returns:
             str: Filepath if the file was downloaded and saved successfully.
@@ -224,26 +663,71 @@ class SoraCamClient(object):
         Raises:
             requests.exceptions.HTTPError: If an HTTP error occurs while
             trying to download the file.
+            requests.exceptions.RequestException: If the connection fails
+            or times out while trying to download the file.
+            soracam.SoraCamException: If the URL does not end with a plain
+            file name.
         """
 
-        path = urlparse(target_url).path
-        filename = unquote(path.split("/")[-1])
-        save_path = os.path.join(target_directory, filename)
-        logger.debug(f"save file to: {save_path} from: {target_url}")
+        filename = unquote(posixpath.basename(urlparse(target_url).path))
+        if filename in ("", ".", "..") or "/" in filename or "\\" in filename:
+            raise sc.SoraCamException(
+                f"Invalid file name {filename!r} in {target_url}"
+            )
+        save_path = os.fspath(Path(target_directory) / filename)
+        logger.debug("save file to: %s from: %s", save_path, target_url)
         try:
-            with requests.get(
-                target_url, stream=True, timeout=_REQUESTS_TIMEOUT
+            with (session or requests).get(
+                target_url, stream=True, timeout=timeout
             ) as r:
                 r.raise_for_status()
+                r.raw.decode_content = True
                 with open(save_path, "wb") as f:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
+                    shutil.copyfileobj(r.raw, f, length=sc.DOWNLOAD_CHUNK_SIZE)
             return save_path
-        except requests.exceptions.HTTPError as err:
-            logger.error(f"download file from {target_url} failed: {err}")
+        except (
+            requests.exceptions.RequestException,
+            Urllib3HTTPError,
+        ) as err:
+            # reading r.raw directly surfaces urllib3 errors unwrapped
+            logger.error("download file from %s failed: %s", target_url, err)
             raise
 
+    def download_files_from_urls(
+        self,
+        target_urls: list,
+        target_directory: str | os.PathLike,
+        max_workers: int = sc.MAX_DOWNLOAD_WORKERS,
+    ) -> list:
+        """
+        Downloads several files concurrently and saves them to the specified
+        path.
+
+        Parameters:
+            target_urls (list): The URLs of the files to download.
+            target_directory (str): The directory where the downloaded files
+            should be saved.
+            max_workers (int): The number of files downloaded in parallel.
+
+        Returns:
+            list: Filepaths of the downloaded files, in the same order as
+            target_urls.
+
+        Raises:
+            requests.exceptions.HTTPError: If an HTTP error occurs while
+            trying to download one of the files.
+        """
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda url: self.download_file_from_url(
+                        url, target_directory, self._session, self._timeout
+                    ),
+                    target_urls,
+                )
+            )
+
     def post_images_export_requests(
         self,
         device_id: str,
@@ -267,8 +751,7 @@ class SoraCamClient(object):
             processing the response.
         """
 
-        path = os.path.join(sc.SORA_CAM_BASE_URL, device_id, "images/exports")
-        url = urljoin(self.api_endpoint, path)
+        url = self._export_url(device_id, sc.MEDIA_IMAGE)
         if not export_time:
             export_time = int(time.time()) * 1000
         payload = {}
@@ -287,19 +770,15 @@ class SoraCamClient(object):
 
         Returns:
             dict: The response from the API, containing the exported image's
-            status information. If there are no export processes,
-            it returns None.
+            status information, as returned by the final status check.
 
         Raises:
             Exception: If an error occurs while sending the GET request.
         """
 
-        path = os.path.join(
-            sc.SORA_CAM_BASE_URL, device_id, "images/exports", export_id
+        return self._check_export_status(
+            device_id, export_id, sc.MEDIA_IMAGE
         )
-        url = urljoin(self.api_endpoint, path)
-        if self._check_export_status(device_id, export_id, sc.MEDIA_IMAGE):
-            return self._get(url)
 
     def get_stream(self, device_id: str, from_t: int, to_t: int) -> dict:
         """
@@ -317,8 +796,7 @@ class SoraCamClient(object):
             Exception: If an error occurs while sending the GET request.
         """
 
-        path = os.path.join(sc.SORA_CAM_BASE_URL, device_id, "stream")
-        url = urljoin(self.api_endpoint, path)
+        url = f"{self._base_url}/{device_id}/stream"
 
         payload = {"from": from_t, "to": to_t}
         return self._post(url, payload)
@@ -342,8 +820,7 @@ class SoraCamClient(object):
             Exception: If an error occurs while sending the POST request.
         """
 
-        path = os.path.join(sc.SORA_CAM_BASE_URL, device_id, "videos/exports")
-        url = urljoin(self.api_endpoint, path)
+        url = self._export_url(device_id, sc.MEDIA_VIDEO)
 
         payload = {"from": from_t, "to": to_t}
         return self._post(url, payload)
@@ -359,24 +836,24 @@ class SoraCamClient(object):
 
         Returns:
             dict: The response from the API, containing the exported video's
-            data or status information. If there are no export processes,
-            it returns None.
+            data or status information, as returned by the final status
+            check.
 
         Raises:
             Exception: If an error occurs while sending the GET request.
         """
 
-        path = os.path.join(
-            sc.SORA_CAM_BASE_URL, device_id, "videos/exports", export_id
+        return self._check_export_status(
+            device_id, export_id, sc.MEDIA_VIDEO
         )
-        url = urljoin(self.api_endpoint, path)
-        if self._check_export_status(device_id, export_id, sc.MEDIA_VIDEO):
-            return self._get(url)
 
     def get_devices(self) -> dict:
         """
         Gets the list of devices information.
 
+        The list is cached for DEVICES_CACHE_SECOND seconds. A copy is
+        returned, so changing it does not change the cache.
+
         Returns:
             list: The list of devices.
 
@@ -384,8 +861,12 @@ class SoraCamClient(object):
             Exception: If an error occurs while sending the GET request.
         """
 
-        url = urljoin(self.api_endpoint, sc.SORA_CAM_BASE_URL)
-        return self._get(url)
+        cached = self._devices_cache
+        if cached and time.monotonic() - cached[0] < sc.DEVICES_CACHE_SECOND:
+            return copy.deepcopy(cached[1])
+        devices = self._get(self._base_url)
+        self._devices_cache = (time.monotonic(), devices)
+        return copy.deepcopy(devices)
 
     def get_offline_devices(self) -> list:
         """
@@ -395,32 +876,66 @@ class SoraCamClient(object):
             list: The list of offline devices.
         """
 
-        off_line_devices = []
-        device_list = self.get_devices()
-        for dv in device_list:
-            if not dv.get("connected", True):
-                device_status = {}
-                device_status["device_name"] = dv.get("name", None)
-                device_status["device_id"] = dv.get("deviceId", None)
-                device_status["last_connection"] = dv.get(
-                    "lastConnectedTime", None
-                )
-                off_line_devices.append(device_status)
-        return off_line_devices
+        return [
+            {
+                "device_name": dv.get("name"),
+                "device_id": dv.get("deviceId"),
+                "last_connection": dv.get("lastConnectedTime"),
+            }
+            for dv in self.get_devices()
+            if not dv.get("connected", True)
+        ]
+
+    def _fetch_paginated_pages(self, url: str, init_params: dict):
+        """
+        Yields the pages of a paginated endpoint one at a time.
+
+        The next page is requested only when the caller asks for it, so
+        a caller that stops iterating fetches no further pages.
+
+        Parameters:
+            url (str): The URL of the endpoint.
+            init_params (dict): The query parameters of the first page.
+
+        Yields:
+            list: The items of each page.
+
+        Raises:
+            Exception: If an error occurs while sending the GET request.
+        """
 
-    def fetch_paginated_data(self, url, init_params):
         params = init_params.copy()
-        aggregated_data = []
         while True:
             response = self._get(url, params, True)
-            if isinstance(response.json(), list):
-                aggregated_data.extend(response.json())
-            elif isinstance(response.json(), dict):
-                aggregated_data.append(response.json())
+            data = _parse_json(response)
+            if isinstance(data, dict):
+                data = [data]
+            elif not isinstance(data, list):
+                data = []
+            yield data
             next_key = response.headers.get("x-soracom-next-key")
             if not next_key:
-                break
+                return
             params["last_evaluated_key"] = next_key
+
+    def fetch_paginated_data(self, url: str, init_params: dict) -> list:
+        """
+        Gets all the pages of a paginated endpoint.
+
+        Parameters:
+            url (str): The URL of the endpoint.
+            init_params (dict): The query parameters of the first page.
+
+        Returns:
+            list: The items of all pages.
+
+        Raises:
+            Exception: If an error occurs while sending the GET request.
+        """
+
+        aggregated_data = []
+        for data in self._fetch_paginated_pages(url, init_params):
+            aggregated_data.extend(data)
         return aggregated_data
 
     def get_devices_events(
@@ -444,42 +959,78 @@ class SoraCamClient(object):
             to_t (int): The end timestamp for the the events.
 
         Returns:
-            list: The list of event of the device.
+            list: The list of event of the device, at most limit events.
+            Pages are fetched only until enough events have been found.
 
         Raises:
             Exception: If an error occurs while sending the GET request.
         """
 
-        path = (
-            os.path.join(sc.SORA_CAM_BASE_URL, "events")
+        url = (
+            f"{self._base_url}/events"
             if not device_id
-            else os.path.join(sc.SORA_CAM_BASE_URL, device_id, "events")
+            else f"{self._base_url}/{device_id}/events"
         )
-        url = urljoin(self.api_endpoint, path)
         params = {"limit": limit, "sort": sort, "search_type": "or"}
         if from_t:
             params["from"] = from_t
         if to_t:
             params["to"] = to_t
-        # repeat if the response header
-        # contains the 'x-soracom-next-key' header.
-        all_events = self.fetch_paginated_data(url, params)
         if label:
-            return [
-                ev
-                for ev in all_events
-                if label
-                in ev.get("eventInfo", {})
-                .get("atomEventV1", {})
-                .get("type", [])
-            ]
-        else:
-            return all_events
+            # let the API narrow down the events, the client-side filter
+            # still applies if the label is not honored
+            params["label"] = label
+
+        def _types(ev, _get=dict.get):
+            info = _get(ev, "eventInfo") or {}
+            atom = _get(info, "atomEventV1") or {}
+            return _get(atom, "type") or ()
+
+        # repeat if the response header
+        # contains the 'x-soracom-next-key' header
+        # until limit events have been collected.
+        all_events = []
+        for events in self._fetch_paginated_pages(url, params):
+            if label:
+                events = [ev for ev in events if label in _types(ev)]
+            all_events.extend(events[: limit - len(all_events)])
+            if len(all_events) >= limit:
+                break
+        return all_events
+
+    def get_devices_events_bulk(
+        self, device_ids: list, max_workers: int = sc.MAX_WORKERS, **kwargs
+    ) -> dict:
+        """
+        Gets the events of several devices concurrently.
+
+        Parameters:
+            device_ids (list): The unique identifiers for the devices.
+            max_workers (int): The number of devices queried in parallel.
+            **kwargs: The arguments passed to get_devices_events.
+
+        Returns:
+            dict: The list of events keyed by device ID.
+
+        Raises:
+            Exception: If an error occurs while sending the GET requests.
+        """
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            events = executor.map(
+                lambda device_id: self.get_devices_events(device_id, **kwargs),
+                device_ids,
+            )
+            return dict(zip(device_ids, events))
 
     def get_device(self, device_id=None) -> dict:
         """
         Gets the device information.
 
+        The information is cached per device for DEVICE_CACHE_SECOND
+        seconds. A copy is returned, so changing it does not change the
+        cache.
+
         Returns:
             dict: Th Dictionary contains the device information.
 
@@ -487,9 +1038,80 @@ class SoraCamClient(object):
             Exception: If an error occurs while sending the GET request.
         """
 
-        device_path = os.path.join(sc.SORA_CAM_BASE_URL, device_id)
-        url = urljoin(self.api_endpoint, device_path)
-        return self._get(url)
+        device = self._cached_device(device_id)
+        if device is not None:
+            return device
+        url = f"{self._base_url}/{device_id}"
+        device = self._get(url)
+        self._device_cache[device_id] = (time.monotonic(), device)
+        return copy.deepcopy(device)
+
+    def _cached_device(self, device_id: str) -> dict | None:
+        """
+        Returns a copy of the cached device information, or None if it is
+        not cached or has expired.
+
+        Parameters:
+            device_id (str): The unique identifier for the device.
+        """
+
+        cached = self._device_cache.get(device_id)
+        if cached and time.monotonic() - cached[0] < sc.DEVICE_CACHE_SECOND:
+            return copy.deepcopy(cached[1])
+        return None
+
+    def invalidate_device(self, device_id: str = None):
+        """
+        Discards the cached device information.
+
+        Parameters:
+            device_id (str): The unique identifier for the device. The cache
+            of all devices is discarded if omitted.
+        """
+
+        if device_id is None:
+            self._device_cache.clear()
+        else:
+            self._device_cache.pop(device_id, None)
+        self._devices_cache = None
+
+    def get_device_bulk(
+        self, device_ids: list, max_workers: int = sc.MAX_WORKERS
+    ) -> dict:
+        """
+        Gets the information of several devices concurrently.
+
+        Devices cached by get_device are not requested again, and the
+        fetched ones are added to the same cache.
+
+        Parameters:
+            device_ids (list): The unique identifiers for the devices.
+            max_workers (int): The number of devices queried in parallel.
+
+        Returns:
+            dict: The device information keyed by device ID.
+
+        Raises:
+            Exception: If an error occurs while sending the GET requests.
+        """
+
+        devices = {}
+        for device_id in device_ids:
+            device = self._cached_device(device_id)
+            if device is not None:
+                devices[device_id] = device
+        missing = [
+            device_id
+            for device_id in dict.fromkeys(device_ids)
+            if device_id not in devices
+        ]
+        urls = [f"{self._base_url}/{device_id}" for device_id in missing]
+        for device_id, device in zip(
+            missing, self._get_many(urls, max_workers)
+        ):
+            self._device_cache[device_id] = (time.monotonic(), device)
+            devices[device_id] = copy.deepcopy(device)
+        return {device_id: devices[device_id] for device_id in device_ids}
 
     def get_device_recordings_and_events(
         self,
@@ -513,10 +1135,7 @@ class SoraCamClient(object):
         Raises:
             Exception: If an error occurs while sending the GET request.
         """
-        path = os.path.join(
-            sc.SORA_CAM_BASE_URL, device_id, "recordings_and_events"
-        )
-        url = urljoin(self.api_endpoint, path)
+        url = f"{self._base_url}/{device_id}/recordings_and_events"
         params = {"sort": sort}
         if from_t:
             params["from"] = from_t
@@ -542,18 +1161,7 @@ class SoraCamClient(object):
         Raises:
             Exception: If an error occurs while sending the GET request.
         """
-        path_components = [
-            sc.SORA_CAM_BASE_URL,
-            device_id,
-            "atomcam",
-            "settings",
-        ]
-        if setting:
-            path_components.append(setting)
-
-        path = os.path.join(*path_components)
-        url = urljoin(self.api_endpoint, path)
-        return self._get(url)
+        return self._get(self._settings_url(device_id, setting))
 
     def post_settings(
         self, device_id: str, setting: str, payload: dict
@@ -572,8 +1180,6 @@ class SoraCamClient(object):
             Exception: If an error occurs while sending the GET request.
         """
 
-        path = os.path.join(
-            sc.SORA_CAM_BASE_URL, device_id, "atomcam/settings/", setting
-        )
-        url = urljoin(self.api_endpoint, path)
-        return self._post(url, payload)
+        response = self._post(self._settings_url(device_id, setting), payload)
+        self.invalidate_device(device_id)
+        return response
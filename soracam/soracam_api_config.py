@@ -1,13 +1,28 @@
 REQUESTS_TIMEOUT = 60
-LOOP_WAITE_SECOND = 10  # wait time for the loop
-LOOP_WAITE_MAX_SECOND = 60
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # buffer size for downloading files
+LOOP_WAITE_SECOND = 0.05  # initial wait time for the loop
+LOOP_WAITE_MAX_SECOND = 5  # the wait time doubles up to this value
+LOOP_WAITE_JITTER_SECOND = 0.05  # random time added to each wait
 WAITE_TIMEOUT = 900  # wait until 900 seconds
 SORA_CAM_BASE_URL = 'v1/sora_cam/devices'
 
 MEDIA_IMAGE = 'images'
 MEDIA_VIDEO = 'videos'
 
+TOKEN_CACHE_SECOND = 3000  # reuse the auth token for 50 minutes
+DEVICE_CACHE_SECOND = 60  # reuse the information of a device for 1 minute
+DEVICES_CACHE_SECOND = 30  # reuse the list of devices for 30 seconds
+
 MAX_API_RETRIES = 3  # number of retry attempts
-RETRY_INTERVAL = 3  # interval between requests
+RETRY_INTERVAL = 3  # base interval between requests
+RETRY_MAX_SECOND = 60  # the longest wait before a retry, even on Retry-After
+
+POOL_CONNECTIONS = 4  # number of connection pools to cache
+POOL_MAXSIZE = 32  # maximum number of connections to keep per pool
+MAX_CONNECTION_RETRIES = 3  # retries performed by the connection adapter
+RETRY_BACKOFF_FACTOR = 0.3  # backoff factor between adapter retries
+MAX_WORKERS = 16  # concurrent requests of bulk methods, <= POOL_MAXSIZE
+MAX_DOWNLOAD_WORKERS = 8  # concurrent downloads, <= POOL_MAXSIZE
+MAX_ASYNC_CONNECTIONS = 64  # connection limit of SoraCamAsyncClient
 
 SORACOM_ENDPOINT = 'https://%s.api.soracom.io/'
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+
+"""
+This module provides an asyncio client to interact with SoraCam API. It
+allows to issue many authenticated requests concurrently from a single
+thread, e.g. to poll several exports at once.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import time
+import soracam as sc
+from soracam.soracam_api import (
+    _BaseSoraCamClient,
+    _DEBUG,
+    _MAX_API_RETRIES,
+    _REQUESTS_TIMEOUT,
+    _RetryBudget,
+    _parse_json,
+    _poll_delay,
+)
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+logger = logging.getLogger(__name__)
+if _DEBUG:
+    logger.setLevel(logging.DEBUG)
+else:
+    logger.setLevel(logging.INFO)
+
+
+class SoraCamAsyncClient(_BaseSoraCamClient):
+    """
+    An asyncio client to interact with the SoraCam API.
+
+    It provides the same export, stream and device methods as
+    SoraCamClient as coroutines. It requires the `async` extra.
+
+    Attributes:
+        api_endpoint (str): The API endpoint to make requests.
+    """
+
+    def __init__(
+        self,
+        coverage_type: str,
+        auth_key_id: str,
+        auth_key: str,
+        http2: bool = True,
+        timeout: float = _REQUESTS_TIMEOUT,
+        max_retries: int = _MAX_API_RETRIES,
+        retry_interval: float = sc.RETRY_INTERVAL,
+        transport=None,
+    ):
+        """
+        Constructs all the necessary attributes for the SoraCamAsyncClient
+        object.
+
+        Parameters:
+            coverage_type (str): The type of network coverage ('jp' or 'g').
+            auth_key_id (str): The authentication key ID.
+            auth_key (str): The authentication key.
+            http2 (bool): Multiplex requests over HTTP/2 connections. It
+            falls back to HTTP/1.1 if the h2 package is not installed.
+            timeout (float): The timeout for API requests in seconds.
+            max_retries (int): The number of attempts per API request.
+            retry_interval (float): The base interval between attempts.
+            transport (httpx.AsyncBaseTransport): The transport to send
+            requests with instead of the network, e.g. for tests.
+
+        Raises:
+            ImportError: If httpx is not installed.
+        """
+
+        if httpx is None:
+            raise ImportError(
+                "SoraCamAsyncClient requires httpx, "
+                "install soracam-python-client[async]"
+            )
+        super().__init__(
+            coverage_type,
+            auth_key_id,
+            auth_key,
+            timeout,
+            max_retries,
+            retry_interval,
+        )
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("h2 is not installed, falling back to HTTP/1.1")
+            http2 = False
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(max_connections=sc.MAX_ASYNC_CONNECTIONS),
+            timeout=timeout,
+            headers={
+                "accept": "application/json",
+                "Content-Type": "application/json",
+            },
+            transport=transport,
+        )
+        self._auth_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes the underlying HTTP client and releases its connections.
+        """
+
+        await self._client.aclose()
+
+    async def _get_headers(self) -> dict:
+        """
+        Returns the authentication headers required for API requests.
+
+        The API key and token are cached on the client and obtained from
+        the auth API only on the first call or after they have expired.
+
+        Returns:
+            dict: The headers to be used for authentication.
+        """
+
+        headers = self._valid_headers()
+        if headers:
+            return headers
+        async with self._auth_lock:
+            headers = self._valid_headers()
+            if headers:
+                return headers
+            try:
+                response = await self._client.post(
+                    self._auth_url, json=self._auth_payload
+                )
+                response.raise_for_status()
+            except Exception as error:
+                logger.error("failed to authenticate: %s", error)
+                raise
+            return self._cache_headers(_parse_json(response))
+
+    async def _request(
+        self, method: str, url: str, params: dict = None, payload=None
+    ) -> dict:
+        """
+        Sends a request to URL, retrying on rate limiting and expired
+        tokens.
+
+        Parameters:
+            method (str): The HTTP method of the request.
+            url (str): The URL to send the request to.
+            params (dict): The query parameters, if any.
+            payload (dict): The payload to include in the request, if any.
+
+        Returns:
+            dict: The response from the API returned by JSON, or an empty
+            dict if the response has no body.
+
+        Raises:
+            httpx.HTTPStatusError: If the API returns an error status.
+            ValueError: If the response body is not valid JSON.
+        """
+
+        retry = _RetryBudget(self)
+        while True:
+            headers = await self._get_headers()
+            try:
+                response = await self._client.request(
+                    method, url, headers=headers, params=params, json=payload
+                )
+                logger.debug(
+                    "%s %s over %s", method, url, response.http_version
+                )
+                response.raise_for_status()
+                if not response.content:
+                    return {}
+                return _parse_json(response)
+            except httpx.HTTPStatusError as err:
+                logger.error("%s request for %s failed: %s", method, url, err)
+                delay = retry.delay(response, headers)
+                if delay is None:
+                    raise
+                if delay:
+                    await asyncio.sleep(delay)
+
+    async def _get(self, url: str, params: dict = None) -> dict:
+        """
+        Sends a GET request to URL.
+
+        Parameters:
+            url (str): The URL for the request send to.
+            params (dict): The query parameters, if any.
+
+        Returns:
+            dict: The response from the API returned by JSON.
+        """
+
+        return await self._request("GET", url, params=params)
+
+    async def _post(self, url: str, payload: dict) -> dict:
+        """
+        Sends a POST request to URL.
+
+        Parameters:
+            url (str): The URL to send the request to.
+            payload (dict): The payload to include in the request.
+
+        Returns:
+            dict: The response from the API returned by JSON.
+        """
+
+        return await self._request("POST", url, payload=payload)
+
+    async def _check_export_status(
+        self,
+        device_id: str,
+        export_id: str,
+        media: str,
+        expected: str = "completed",
+    ) -> dict:
+        """
+        Checks the export status of a device.
+
+        Parameters:
+            device_id (str): The unique identifier for the device.
+            export_id (str): The unique identifier for the export process.
+            media (str): The media type ('images' or 'videos').
+            expected (str): The expected status of the export process.
+
+        Returns:
+            dict: The export information returned by the API once the
+            export process is complete.
+
+        Raises:
+            soracaom.SoraCamException.ExportFailedError: \
+                If the export process fails.
+            soracaom.SoraCamException.ExportTimeoutError: \
+                If checking the export status times out.
+        """
+
+        url = self._export_url(device_id, media, export_id)
+        deadline = time.monotonic() + sc.WAITE_TIMEOUT
+        wait_time = sc.LOOP_WAITE_SECOND
+        while time.monotonic() < deadline:
+            response = await self._get(url)
+            if self._export_done(response, expected, device_id, export_id):
+                return response
+            await asyncio.sleep(_poll_delay(wait_time, deadline))
+            wait_time = min(wait_time * 2, sc.LOOP_WAITE_MAX_SECOND)
+        raise self._export_timeout(device_id, export_id)
+
+    async def check_exports_bulk(
+        self, exports: list, media: str, expected: str = "completed"
+    ) -> list:
+        """
+        Checks the export status of several exports concurrently.
+
+        Parameters:
+            exports (list): The (device_id, export_id) pairs to check.
+            media (str): The media type ('images' or 'videos').
+            expected (str): The expected status of the export processes.
+
+        Returns:
+            list: The export information of each pair once complete, in
+            the same order as exports.
+        """
+
+        return await asyncio.gather(
+            *[
+                self._check_export_status(dv_id, export_id, media, expected)
+                for dv_id, export_id in exports
+            ]
+        )
+
+    async def post_images_export_requests(
+        self,
+        device_id: str,
+        wide_angle_correction: bool = True,
+        export_time: int = 0,
+    ) -> dict:
+        """
+        Sends an exporting image request from recorded video.
+
+        Parameters:
+            device_id (str): The unique identifier for the device.
+            wide_angle_correction (bool): Enable wide_angle_correction.
+            export_time (int): The target export time
+
+        Returns:
+            dict: The response from the API including containing the result
+            of export request.
+        """
+
+        url = self._export_url(device_id, sc.MEDIA_IMAGE)
+        if not export_time:
+            export_time = int(time.time()) * 1000
+        payload = {"time": export_time}
+        if wide_angle_correction:
+            payload["imageFilters"] = ["wide_angle_correction"]
+        return await self._post(url, payload)
+
+    async def get_images_exports(self, device_id: str, export_id: str) -> dict:
+        """
+        Return the result of the images exports request.
+
+        Parameters:
+            device_id (str): The unique identifier for the camera device.
+            export_id (str): The unique identifier for the export process.
+
+        Returns:
+            dict: The response from the API, containing the exported image's
+            status information, as returned by the final status check.
+        """
+
+        return await self._check_export_status(
+            device_id, export_id, sc.MEDIA_IMAGE
+        )
+
+    async def get_stream(self, device_id: str, from_t: int, to_t: int) -> dict:
+        """
+        Sends a get stream request from recorded video.
+
+        Parameters:
+            device_id (str): The unique identifier for the device.
+            from_t (int): The start timestamp of the stream.
+            to_t (int): The end timestamp of the stream.
+
+        Returns:
+            dict: The response from the API, containing the stream data.
+        """
+
+        url = f"{self._base_url}/{device_id}/stream"
+        return await self._post(url, {"from": from_t, "to": to_t})
+
+    async def post_videos_export_requests(
+        self, device_id: str, from_t: int, to_t: int
+    ) -> dict:
+        """
+        Sends an exporting video request from recorded video.
+
+        Parameters:
+            device_id (str): The unique identifier for the camera device.
+            from_t (int): The start timestamp of the stream.
+            to_t (int): The end timestamp of the stream.
+
+        Returns:
+            dict: The response from the API including containing the result
+            of export request.
+        """
+
+        url = self._export_url(device_id, sc.MEDIA_VIDEO)
+        return await self._post(url, {"from": from_t, "to": to_t})
+
+    async def get_videos_exports(self, device_id: str, export_id: str) -> dict:
+        """
+        Return the result of the video exports request.
+
+        Parameters:
+            device_id (str): The unique identifier for the device.
+            export_id (str): The unique identifier for the export process.
+
+        Returns:
+            dict: The response from the API, containing the exported video's
+            data or status information, as returned by the final status
+            check.
+        """
+
+        return await self._check_export_status(
+            device_id, export_id, sc.MEDIA_VIDEO
+        )
+
+    async def get_devices(self) -> list:
+        """
+        Gets the list of devices information.
+
+        Returns:
+            list: The list of devices.
+        """
+
+        return await self._get(self._base_url)
+
+    async def get_device(self, device_id: str) -> dict:
+        """
+        Gets the device information.
+
+        Returns:
+            dict: Th Dictionary contains the device information.
+        """
+
+        return await self._get(f"{self._base_url}/{device_id}")
@@ -4,11 +4,12 @@
 import os
 import logging
 import pathlib
-import shutil
+import unittest.mock as mock
+from urllib.parse import urlparse
 import filetype
-import glob
-import tempfile
 import pytest
+import requests
+import vcr
 from dotenv import load_dotenv
 import soracam as sc
 import time
@@ -19,13 +20,18 @@ _VIDEO_DURATION = os.environ.get('VIDEO_DURATION', 10000)
 _VIDEO_OFFSET = os.environ.get('VIDEO_OFFSET', 1000)
 _DEVICE_ID = os.environ.get('DEVICE_ID', '')
 
-_DEBUG = os.environ.get('DEBUG', 'True').lower() in ['true', '1']
+_DEBUG = os.environ.get('DEBUG', 'True').lower() in {'true', '1', 'yes'}
 
-_BEFOR_ONE_WEEK_FROM_T = (int(time.time()) - (7 * 24 * 60 * 60)) * 1000
+# record missing API calls, replay the recorded ones
+_VCR_RECORD_MODE = os.environ.get('VCR_RECORD_MODE', 'new_episodes')
+
+# computed once so the time range queries are the same for every test in
+# a session; the cassettes ignore the range, see _query_without_time_range
+_NOW_MS = int(time.time()) * 1000
+_BEFOR_ONE_WEEK_FROM_T = _NOW_MS - (7 * 24 * 60 * 60) * 1000
 
 # log settings
-FORMAT = '%(levelname)s %(asctime)s \
-    %(funcName)s %(filename)s %(lineno)d %(message)s'
+FORMAT = '%(levelname)s %(asctime)s %(name)s %(message)s'
 logging.basicConfig(format=FORMAT)
 logger = logging.getLogger(__name__)
 if _DEBUG:
@@ -34,6 +40,84 @@ else:
     logger.setLevel(logging.INFO)
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        '--live', action='store_true', default=False,
+        help='run the tests waiting for exports rendered by the camera')
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers', 'live: wait for exports rendered by the camera, '
+        'skipped unless --live is given')
+    # registered here as well so the marker is known without pytest-xdist
+    config.addinivalue_line(
+        'markers', 'xdist_group(name): run the tests of a group on one worker')
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--live'):
+        return
+    skip_live = pytest.mark.skip(reason='need --live option to run')
+    for item in items:
+        if 'live' in item.keywords:
+            item.add_marker(skip_live)
+
+
+def _skip_auth_request(request):
+    # never record /v1/auth, so authentication always goes live and no
+    # credentials or tokens are written to the cassettes
+    if urlparse(request.uri).path.endswith('/v1/auth'):
+        return None
+    return request
+
+
+def _skip_unauthorized_response(response):
+    # a rejected token must not be replayed on later runs
+    if response['status']['code'] == 401:
+        return None
+    return response
+
+
+# query parameters holding the current time, which differ on every run
+_TIME_RANGE_PARAMS = {'from', 'to'}
+
+
+def _query_without_time_range(r1, r2):
+    # the time range moves with each run, so a recorded request must match
+    # on every other query parameter only
+    def query(r):
+        return [q for q in r.query if q[0] not in _TIME_RANGE_PARAMS]
+    assert query(r1) == query(r2)
+
+
+_vcr = vcr.VCR(
+    cassette_library_dir=str(pathlib.Path(__file__).parent / 'fixtures'),
+    record_mode=_VCR_RECORD_MODE,
+    match_on=['method', 'scheme', 'host', 'path', 'query_without_time_range'],
+    filter_headers=['X-Soracom-API-Key', 'X-Soracom-Token'],
+    decode_compressed_response=True,
+    before_record_request=_skip_auth_request,
+    before_record_response=_skip_unauthorized_response,
+)
+_vcr.register_matcher('query_without_time_range', _query_without_time_range)
+
+
+@pytest.fixture(autouse=True)
+def vcr_cassette(request):
+    # only the tests calling the API through sora_cam_client are recorded;
+    # live tests must reach the camera and mocked tests intercept by
+    # themselves
+    if (
+        'sora_cam_client' not in request.fixturenames
+        or request.node.get_closest_marker('live')
+    ):
+        yield None
+        return
+    with _vcr.use_cassette(f'{request.node.name}.yaml') as cassette:
+        yield cassette
+
+
 @pytest.fixture(scope='session')
 def sora_cam_client():
     auth_key_id = os.environ.get(
@@ -47,12 +131,55 @@ def sora_cam_client():
         auth_key_id=auth_key_id,
         auth_key=auth_key)
     logger.debug("client has been created")
+    if _VCR_RECORD_MODE == 'none':
+        # auth is never recorded and nothing goes live in this mode, so
+        # the replayed requests are sent with a dummy token
+        with mock.patch.object(
+                client, '_authenticate',
+                return_value={'X-Soracom-API-Key': 'DUMMY',
+                              'X-Soracom-Token': 'DUMMY'}):
+            yield client
+    else:
+        yield client
+
+
+@pytest.fixture
+def stub_client():
+    # the client authenticates lazily, so a client built from dummy keys
+    # never reaches the API as long as the tests intercept its requests;
+    # a new one per test keeps its token and device caches from leaking
+    client = sc.SoraCamClient(
+        coverage_type='jp',
+        auth_key_id='auth_key_id',
+        auth_key='auth_key')
     yield client
+    client.close()
+
+
+_SESSION_CASSETTE = 'session.yaml'
+
+
+def _session_cassette():
+    # every pytest-xdist worker runs the session fixtures, and concurrent
+    # workers would rewrite the shared cassette, so only a run without
+    # xdist records it and the workers replay it
+    if not os.environ.get('PYTEST_XDIST_WORKER'):
+        return _vcr.use_cassette(_SESSION_CASSETTE)
+    if not (pathlib.Path(_vcr.cassette_library_dir)
+            / _SESSION_CASSETTE).exists():
+        pytest.fail(f'{_SESSION_CASSETTE} is recorded only without '
+                    'pytest-xdist, run the tests once without -n first')
+    return _vcr.use_cassette(_SESSION_CASSETTE, record_mode='none')
+
+
+@pytest.fixture(scope='session')
+def device_list(sora_cam_client):
+    with _session_cassette():
+        return sora_cam_client.get_devices()
 
 
-@pytest.fixture(scope="session", autouse=True)
-def soracom_device(sora_cam_client):
-    device_list = sora_cam_client.get_devices()
+@pytest.fixture(scope="session")
+def soracom_device(device_list):
     device = None
     for dv in device_list:
         if dv.get('connected', True) and dv.get('deviceId', '') == _DEVICE_ID:
@@ -62,22 +189,40 @@ def soracom_device(sora_cam_client):
     yield device.get('deviceId', '')
 
 
-def download_file_and_check_mime_type(url, out_file):
-    with tempfile.TemporaryDirectory() as dname:
-        save_path = sc.SoraCamClient.download_file_from_url(url, dname)
-        if save_path:
-            if pathlib.Path(save_path).suffix == ".zip":
-                logger.info("f_name: {save_path}")
-                shutil.unpack_archive(save_path, dname)
-                mime_type = 'video/mp4'
-                files = glob.glob(dname+'/*.mp4')
-                shutil.move(files[-1], out_file)
-            else:
-                shutil.move(save_path, out_file)
-                mime_type = 'image/jpeg'
-            if filetype.guess(out_file).mime != mime_type:
-                logger.error(f"mime type {0} is not expected type {1}".
-                             format(filetype.guess(out_file).mime, mime_type))
-                return False
-            else:
-                return True
+@pytest.fixture(scope='session')
+def recent_events(sora_cam_client, soracom_device):
+    # one broad fetch shared by the event tests, which filter it locally
+    with _session_cassette():
+        return sora_cam_client.get_devices_events(
+            soracom_device,
+            from_t=_BEFOR_ONE_WEEK_FROM_T,
+            to_t=_NOW_MS,
+            limit=200)
+
+
+def event_labels(event):
+    info = event.get('eventInfo') or {}
+    atom = info.get('atomEventV1') or {}
+    return atom.get('type') or ()
+
+
+# number of leading bytes enough for filetype to sniff the file type
+_MIME_SNIFF_SIZE = 512
+
+
+def download_file_and_check_mime_type(url):
+    # fetch only the head of the file and sniff its type from the magic
+    # number; a HEAD request would not match the presigned GET signature
+    if pathlib.Path(urlparse(url).path).suffix == '.zip':
+        mime_type = 'application/zip'
+    else:
+        mime_type = 'image/jpeg'
+    with requests.get(url, stream=True, timeout=sc.REQUESTS_TIMEOUT) as r:
+        r.raise_for_status()
+        head = r.raw.read(_MIME_SNIFF_SIZE, decode_content=True)
+    kind = filetype.guess(head)
+    if kind is None or kind.mime != mime_type:
+        logger.error("mime type %s is not expected type %s",
+                     kind and kind.mime, mime_type)
+        return False
+    return True
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+
+import asyncio
+import json
+import unittest.mock as mock
+import pytest
+import soracam as sc
+
+httpx = pytest.importorskip("httpx")
+
+_AUTH = {"apiKey": "test_key", "token": "test_token"}
+
+
+def _client(handler, **kwargs):
+    return sc.SoraCamAsyncClient(
+        "jp",
+        "auth_key_id",
+        "auth_key",
+        http2=False,
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+def _responder(responses):
+    # answers /v1/auth with a token and every other request with the next
+    # (status, body, headers) of responses, repeating the last one
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if request.url.path.endswith("/v1/auth"):
+            return httpx.Response(200, json=_AUTH)
+        status, body, headers = responses[
+            min(len([c for c in calls if "/v1/auth" not in c.url.path]),
+                len(responses)) - 1
+        ]
+        return httpx.Response(status, json=body, headers=headers)
+
+    return handler, calls
+
+
+def _auth_calls(calls):
+    return [c for c in calls if c.url.path.endswith("/v1/auth")]
+
+
+def test_async_headers_cached():
+    handler, calls = _responder([(200, [{"deviceId": "d"}], {})])
+
+    async def run():
+        async with _client(handler) as client:
+            # concurrent requests share the single token refresh
+            return await asyncio.gather(
+                client.get_devices(), client.get_device("d")
+            )
+
+    devices, device = asyncio.run(run())
+    assert devices == [{"deviceId": "d"}]
+    assert len(_auth_calls(calls)) == 1
+    assert all(
+        c.headers["X-Soracom-Token"] == "test_token"
+        for c in calls
+        if "/v1/auth" not in c.url.path
+    )
+
+
+def test_async_reauthenticates_once_on_401():
+    handler, calls = _responder(
+        [(401, {}, {}), (200, {"deviceId": "d"}, {})]
+    )
+
+    async def run():
+        async with _client(handler, max_retries=1) as client:
+            return await client.get_device("d")
+
+    assert asyncio.run(run()) == {"deviceId": "d"}
+    assert len(_auth_calls(calls)) == 2
+
+
+def test_async_retries_on_429(caplog):
+    handler, calls = _responder([(429, {}, {"Retry-After": "7"})])
+    sleep = mock.AsyncMock()
+
+    async def run():
+        async with _client(handler, max_retries=3) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get_devices()
+
+    with mock.patch("soracam.soracam_async_api.asyncio.sleep", new=sleep):
+        asyncio.run(run())
+    assert len(calls) - len(_auth_calls(calls)) == 3
+    # no sleep after the last attempt, Retry-After bounds the others
+    assert sleep.await_count == 2
+    assert all(call.args[0] >= 7 for call in sleep.await_args_list)
+    # the failures are logged under the async module's own logger
+    assert {r.name for r in caplog.records if "429" in r.getMessage()} == {
+        "soracam.soracam_async_api"
+    }
+
+
+def test_async_check_exports_bulk():
+    polls = {}
+
+    def handler(request):
+        if request.url.path.endswith("/v1/auth"):
+            return httpx.Response(200, json=_AUTH)
+        export_id = request.url.path.split("/")[-1]
+        polls[export_id] = polls.get(export_id, 0) + 1
+        # e1 completes on the third poll, e2 on the first
+        done = polls[export_id] >= (3 if export_id == "e1" else 1)
+        status = "completed" if done else "processing"
+        return httpx.Response(
+            200, content=json.dumps({"exportId": export_id, "status": status})
+        )
+
+    async def run():
+        async with _client(handler) as client:
+            return await client.check_exports_bulk(
+                [("d", "e1"), ("d", "e2")], sc.MEDIA_IMAGE
+            )
+
+    with mock.patch(
+        "soracam.soracam_async_api.asyncio.sleep", new=mock.AsyncMock()
+    ):
+        res = asyncio.run(run())
+    assert [r["exportId"] for r in res] == ["e1", "e2"]
+    assert polls == {"e1": 3, "e2": 1}
+
+
+def test_negative_async_check_export_status_failed():
+    handler, _ = _responder([(200, {"status": "failed"}, {})])
+
+    async def run():
+        async with _client(handler) as client:
+            await client.get_videos_exports("d", "e1")
+
+    with pytest.raises(sc.ExportFailedError):
+        asyncio.run(run())
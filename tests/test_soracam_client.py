@@ -1,37 +1,198 @@
 #!/usr/bin/env python3
 
+import itertools
+import json
 import os
+import pathlib
+import re
 import time
 import unittest.mock as mock
-from unittest.mock import patch
 import pytest
+import requests
+import responses
 import soracam as sc
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 
 from .conftest import (
     _VIDEO_DURATION,
     _VIDEO_OFFSET,
     _BEFOR_ONE_WEEK_FROM_T,
+    _NOW_MS,
     logger,
     download_file_and_check_mime_type,
+    event_labels,
 )
 
 
+_AUTH_URL = re.compile(r".*/v1/auth")
+_EXPORT_URL = re.compile(r".*/sora_cam/devices/.*/media/exports/.*")
+
+
+def _add_auth_response():
+    responses.add(
+        responses.POST,
+        _AUTH_URL,
+        json={"apiKey": "test_key", "token": "test_token"},
+    )
+
+
 # Mocking requests for testing
-@patch("requests.post")
-def test_soracam_headers(mock_post):
-    mock_post.return_value.json.return_value = {
-        "apiKey": "test_key",
-        "token": "test_token",
-    }
+@responses.activate
+def test_soracam_headers():
+    _add_auth_response()
     client = sc.SoraCamClient("jp", "auth_key_id", "auth_key")
-    headers = next(client._soracom_headers())
+    headers = client._get_headers()
     assert headers["X-Soracom-API-Key"] == "test_key"
     assert headers["X-Soracom-Token"] == "test_token"
+    # the token is cached, so the auth API is called only once
+    assert client._get_headers() == headers
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_soracam_headers_invalidated_while_checked(stub_client):
+    _add_auth_response()
+    headers = stub_client._get_headers()
+
+    class RacyClient(sc.SoraCamClient):
+        # another thread invalidates the token right after every read of
+        # the cached headers
+        @property
+        def _cached_headers(self):
+            cached = self.__dict__["_cached_headers"]
+            self.__dict__["_cached_headers"] = {}
+            return cached
+
+        @_cached_headers.setter
+        def _cached_headers(self, value):
+            self.__dict__["_cached_headers"] = value
+
+    stub_client.__class__ = RacyClient
+    assert stub_client._get_headers() == headers
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_request_empty_and_non_json_body(stub_client):
+    _add_auth_response()
+    url = f"{stub_client._base_url}/d"
+    responses.add(responses.POST, url, body=b"")
+    responses.add(
+        responses.GET,
+        url,
+        body=b"<html>maintenance</html>",
+        content_type="text/html",
+    )
+    assert stub_client._post(url, {}) == {}
+    with pytest.raises(ValueError):
+        stub_client._get(url)
+
+
+@responses.activate
+def test_request_reauthenticates_once_on_401():
+    _add_auth_response()
+    client = sc.SoraCamClient("jp", "auth_key_id", "auth_key", max_retries=1)
+    url = f"{client._base_url}/d"
+    responses.add(responses.GET, url, status=401)
+    responses.add(responses.GET, url, json={"deviceId": "d"})
+    # the retry with a new token is made even when max_retries is used up
+    assert client._get(url) == {"deviceId": "d"}
+    assert [c.request.method for c in responses.calls] == [
+        "POST",
+        "GET",
+        "POST",
+        "GET",
+    ]
+    responses.add(responses.GET, url, status=401)
+    responses.add(responses.GET, url, status=401)
+    with pytest.raises(requests.exceptions.HTTPError):
+        client._get(url)
+
+
+@responses.activate
+def test_request_retries_on_429():
+    _add_auth_response()
+    client = sc.SoraCamClient("jp", "auth_key_id", "auth_key", max_retries=3)
+    url = f"{client._base_url}/d"
+    responses.add(responses.GET, url, status=429)
+    responses.add(responses.GET, url, status=401)
+    responses.add(responses.GET, url, status=429)
+    responses.add(responses.GET, url, json={"deviceId": "d"})
+    with mock.patch("soracam.soracam_api.time.sleep") as mock_sleep:
+        assert client._get(url) == {"deviceId": "d"}
+    assert mock_sleep.call_count == 2
+    responses.add(responses.GET, url, status=429, headers={"Retry-After": "7"})
+    with mock.patch("soracam.soracam_api.time.sleep") as mock_sleep:
+        with pytest.raises(requests.exceptions.HTTPError):
+            client._get(url)
+    # no sleep after the last attempt, Retry-After bounds the others
+    assert mock_sleep.call_count == 2
+    assert all(call.args[0] >= 7 for call in mock_sleep.call_args_list)
+
+
+@pytest.mark.parametrize("retry_after", ["86400", "inf"])
+def test_retry_delay_capped(retry_after):
+    response = requests.Response()
+    response.status_code = 429
+    response.headers["Retry-After"] = retry_after
+    # a huge Retry-After still waits no longer than RETRY_MAX_SECOND
+    for attempt in range(5):
+        assert sc.soracam_api._retry_delay(attempt, response) == (
+            sc.RETRY_MAX_SECOND
+        )
+
+
+@responses.activate
+def test_device_caches(stub_client):
+    _add_auth_response()
+    devices_url = stub_client._base_url
+    device_url = f"{devices_url}/d"
+    responses.add(responses.GET, devices_url, json=[{"deviceId": "d"}])
+    responses.add(responses.GET, device_url, json={"deviceId": "d"})
+    responses.add(
+        responses.POST, f"{device_url}/atomcam/settings/logo", body=b""
+    )
 
+    def gets(url):
+        return [
+            c
+            for c in responses.calls
+            if c.request.method == "GET" and c.request.url == url
+        ]
 
-def test_soracam_get_devices(sora_cam_client):
-    device_list = sora_cam_client.get_devices()
+    devices = stub_client.get_devices()
+    device = stub_client.get_device("d")
+    # the results are copies, changing them leaves the cache untouched
+    devices.append({"deviceId": "other"})
+    device["name"] = "changed"
+    assert stub_client.get_devices() == [{"deviceId": "d"}]
+    assert stub_client.get_device("d") == {"deviceId": "d"}
+    assert stub_client.get_device_bulk(["d"]) == {"d": {"deviceId": "d"}}
+    assert len(gets(devices_url)) == 1
+    assert len(gets(device_url)) == 1
+
+    # changing a setting drops the cache of the device and the list
+    stub_client.post_settings("d", "logo", {"state": "off"})
+    stub_client.get_devices()
+    stub_client.get_device("d")
+    assert len(gets(devices_url)) == 2
+    assert len(gets(device_url)) == 2
+
+    stub_client.invalidate_device()
+    stub_client.get_device_bulk(["d", "d"])
+    assert len(gets(device_url)) == 3
+
+    # entries expire after their TTL
+    with mock.patch.object(sc, "DEVICE_CACHE_SECOND", 0), mock.patch.object(
+        sc, "DEVICES_CACHE_SECOND", 0
+    ):
+        stub_client.get_devices()
+        stub_client.get_device("d")
+    assert len(gets(devices_url)) == 3
+    assert len(gets(device_url)) == 4
+
+
+def test_soracam_get_devices(device_list):
     assert len(device_list)
 
 
@@ -40,8 +201,10 @@ def test_soracam_get_device(sora_cam_client, soracom_device):
     assert device_info.get("deviceId") == soracom_device
 
 
-def test_get_offline_devices(sora_cam_client):
-    device_list = sora_cam_client.get_devices()
+def test_get_offline_devices(sora_cam_client, device_list):
+    # device_list filled the cache, so drop it to check a fresh list
+    # against the one fetched by the fixture
+    sora_cam_client.invalidate_device()
     off_device_list = sora_cam_client.get_offline_devices()
     off_line = False
     for dv in device_list:
@@ -49,63 +212,115 @@ def test_get_offline_devices(sora_cam_client):
             off_line = True
             break
     if off_line:
-        assert len(off_device_list), "there should be no offline device"
-    else:
-        assert not len(
+        assert len(
             off_device_list
         ), "there should be more than one offline device"
+    else:
+        assert not len(off_device_list), "there should be no offline device"
 
 
-def test_get_devices_events(sora_cam_client, soracom_device):
+def test_get_devices_events(recent_events):
     # assume there are several device events,
     # otherwise the tests fails
-    device_event = sora_cam_client.get_devices_events(
-        soracom_device, limit=100
-    )
-    logger.debug(f"devices events: {device_event}")
-    assert len(device_event), "there should be device_event"
+    logger.debug("devices events: %s", recent_events)
+    assert len(recent_events), "there should be device_event"
 
 
-def test_get_devices_events_with_label(sora_cam_client, soracom_device):
+def test_get_devices_events_with_label(recent_events):
     # assume there are events with person label,
     # otherwise the tests fails
-    device_event = sora_cam_client.get_devices_events(
-        soracom_device, limit=100, label="person"
-    )
-    logger.debug(f"devices events: {device_event}")
+    device_event = [
+        ev for ev in recent_events if "person" in event_labels(ev)
+    ]
+    logger.debug("devices events: %s", device_event)
     assert len(device_event), "there should be device_event with person"
 
 
-def test_get_devices_events_with_from_to(sora_cam_client, soracom_device):
+def test_get_devices_events_with_from_to(recent_events):
     # assume there are several device events,
     # otherwise the tests fails
-    from_t = _BEFOR_ONE_WEEK_FROM_T
-    to_t = int(time.time()) * 1000
-    device_event = sora_cam_client.get_devices_events(
-        soracom_device,
-        from_t=from_t,
-        to_t=to_t,
-        limit=100,
-        sort="desc",
-        label="motion",
-    )
-    logger.debug(f"devices events: {device_event}")
+    # recent_events is already limited to the last week
+    device_event = [
+        ev for ev in recent_events if "motion" in event_labels(ev)
+    ]
+    logger.debug("devices events: %s", device_event)
     assert len(device_event), "there should be device_event"
 
 
+def _event(label):
+    return {"eventInfo": {"atomEventV1": {"type": [label]}}}
+
+
+@responses.activate
+def test_get_devices_events_stops_paging_at_limit(stub_client):
+    _add_auth_response()
+    url = f"{stub_client._base_url}/d/events"
+    for key in ("k1", "k2"):
+        responses.add(
+            responses.GET,
+            url,
+            json=[_event("motion"), _event("motion")],
+            headers={"x-soracom-next-key": key},
+        )
+    res = stub_client.get_devices_events("d", limit=3)
+    # the events are truncated to limit and the last page is not fetched
+    assert len(res) == 3
+    polls = [c for c in responses.calls if c.request.method == "GET"]
+    assert len(polls) == 2
+    assert "limit=3" in polls[0].request.url
+    assert "last_evaluated_key=k1" in polls[1].request.url
+
+
+@responses.activate
+def test_get_devices_events_with_label_filter(stub_client):
+    _add_auth_response()
+    url = f"{stub_client._base_url}/d/events"
+    responses.add(
+        responses.GET,
+        url,
+        json=[_event("motion"), _event("person"), {"eventInfo": None}],
+        headers={"x-soracom-next-key": "k1"},
+    )
+    responses.add(
+        responses.GET, url, json=[_event("person"), _event("person")]
+    )
+    res = stub_client.get_devices_events("d", limit=2, label="person")
+    assert res == [_event("person"), _event("person")]
+    polls = [c for c in responses.calls if c.request.method == "GET"]
+    assert len(polls) == 2
+    assert "label=person" in polls[0].request.url
+
+
+@responses.activate
+def test_get_devices_events_all_pages_below_limit(stub_client):
+    _add_auth_response()
+    url = f"{stub_client._base_url}/events"
+    responses.add(
+        responses.GET,
+        url,
+        json=[_event("motion")],
+        headers={"x-soracom-next-key": "k1"},
+    )
+    responses.add(responses.GET, url, json=[_event("person")])
+    res = stub_client.get_devices_events(limit=10)
+    assert res == [_event("motion"), _event("person")]
+
+
+@pytest.mark.live
 def test_post_and_get_images_export_requests(sora_cam_client, soracom_device):
     res = sora_cam_client.post_images_export_requests(soracom_device, True)
-    logger.debug(f"response: {res}")
+    logger.debug("response: %s", res)
     export_id = res.get("exportId", "")
     assert export_id, "exportId must be included"
     res = sora_cam_client.get_images_exports(soracom_device, export_id)
     assert len(res), "result must be included"
     url = res.get("url", "")
     assert download_file_and_check_mime_type(
-        url, "out.jpg"
+        url
     ), f"failed to download from {url}"
 
 
+@pytest.mark.live
 def test_post_and_get_videos_export_requests(sora_cam_client, soracom_device):
     from_t = int((time.time() - _VIDEO_DURATION - _VIDEO_OFFSET) * 1000)
     to_t = from_t + _VIDEO_DURATION
@@ -113,44 +328,89 @@ def test_post_and_get_videos_export_requests(sora_cam_client, soracom_device):
     res = sora_cam_client.post_videos_export_requests(
         soracom_device, from_t, to_t
     )
-    logger.debug(f"response: {res}")
+    logger.debug("response: %s", res)
     export_id = res.get("exportId", "")
     assert export_id, "exportId must be included"
     res = sora_cam_client.get_videos_exports(soracom_device, export_id)
     assert len(res), "result must be included"
     url = res.get("url", "")
     assert (
-        download_file_and_check_mime_type(url, "out.zip") is True
+        download_file_and_check_mime_type(url) is True
     ), f"failed to download from {url}"
 
 
-def test_check_export_status_timeout(soracom_device):
-    mock_get = mock.Mock(return_value={"status": "not completed"})
-    # Use the patch method to replace _get with your mock
-    with mock.patch.object(sc.SoraCamClient, "_get", new=mock_get):
-        instance = sc.SoraCamClient("jp", "auth_key_id", "auth_key")
-        sc.WAITE_TIMEOUT = 1
-        sc.LOOP_WAITE_TIME = 0.5
+@responses.activate
+def test_check_export_status_timeout(stub_client):
+    _add_auth_response()
+    responses.add(
+        responses.GET, _EXPORT_URL, json={"status": "not completed"}
+    )
+    # the clock advances 0.6 s per reading, so the 1 s timeout trips
+    # after the first poll without sleeping for real
+    with mock.patch.object(sc, "WAITE_TIMEOUT", 1), mock.patch(
+        "soracam.soracam_api.time.sleep"
+    ) as mock_sleep, mock.patch(
+        "soracam.soracam_api.time.monotonic",
+        side_effect=itertools.count(0, 0.6),
+    ):
         with pytest.raises(sc.ExportTimeoutError):
-            instance._check_export_status(
-                device_id=soracom_device,
-                export_id="export",
-                media="media",
-                expected="completed",
-            )
-
-
-def test_negative_check_export_status_failed(sora_cam_client, soracom_device):
-    mock_get = mock.Mock(return_value={"status": "failed"})
-    with mock.patch.object(sc.SoraCamClient, "_get", new=mock_get):
-        instance = sc.SoraCamClient("jp", "auth_key_id", "auth_key")
-        with pytest.raises(sc.ExportFailedError):
-            instance._check_export_status(
-                device_id=soracom_device,
+            stub_client._check_export_status(
+                device_id="d",
                 export_id="export",
                 media="media",
                 expected="completed",
             )
+    polls = [c for c in responses.calls if c.request.method == "GET"]
+    assert len(polls) == 1
+    assert polls[0].request.url.endswith(
+        "/v1/sora_cam/devices/d/media/exports/export"
+    )
+    mock_sleep.assert_called_once()
+
+
+@responses.activate
+def test_check_export_status_backoff(stub_client):
+    _add_auth_response()
+    for _ in range(5):
+        responses.add(
+            responses.GET, _EXPORT_URL, json={"status": "processing"}
+        )
+    responses.add(responses.GET, _EXPORT_URL, json={"status": "completed"})
+    with mock.patch.object(sc, "LOOP_WAITE_SECOND", 0.05), mock.patch.object(
+        sc, "LOOP_WAITE_MAX_SECOND", 0.2
+    ), mock.patch.object(
+        sc, "LOOP_WAITE_JITTER_SECOND", 0.05
+    ), mock.patch(
+        "soracam.soracam_api.time.sleep"
+    ) as mock_sleep, mock.patch(
+        "soracam.soracam_api.time.monotonic",
+        side_effect=itertools.count(0, 0.01),
+    ):
+        res = stub_client._check_export_status(
+            device_id="d",
+            export_id="export",
+            media="media",
+            expected="completed",
+        )
+    assert res == {"status": "completed"}
+    # the wait doubles up to the cap, plus at most the jitter
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    for delay, wait_time in zip(delays, [0.05, 0.1, 0.2, 0.2, 0.2]):
+        assert wait_time <= delay <= wait_time + 0.05
+    assert len(delays) == 5
+
+
+@responses.activate
+def test_negative_check_export_status_failed(stub_client):
+    _add_auth_response()
+    responses.add(responses.GET, _EXPORT_URL, json={"status": "failed"})
+    with pytest.raises(sc.ExportFailedError):
+        stub_client._check_export_status(
+            device_id="d",
+            export_id="export",
+            media="media",
+            expected="completed",
+        )
 
 
 @pytest.mark.skipif(
@@ -164,25 +424,26 @@ def test_negative_post_videos_export_requests_parallel(
     from_t = int((time.time() - _VIDEO_DURATION - _VIDEO_OFFSET) * 1000)
     to_t = from_t + _VIDEO_DURATION
     export_request = (soracom_device, from_t, to_t)
-    tasks = []
-    for _ in range(10):
-        tasks.append(export_request)
-    with ThreadPoolExecutor() as executor:
-        results = [
-            executor.submit(sora_cam_client.post_videos_export_requests, *task)
-            for task in tasks
-        ]
-        for res in as_completed(results):
-            try:
-                export_id = res.get("exportId", "")
-                print("task returned: ", export_id)
-            except Exception as error:
-                print(f"task generated an exception: {error}")
+    tasks = [export_request] * 10
+
+    def post_export(task):
+        # return the exception so that one failure does not stop the map
+        try:
+            return sora_cam_client.post_videos_export_requests(*task)
+        except Exception as error:
+            return error
+
+    with ThreadPoolExecutor(max_workers=min(len(tasks), 4)) as executor:
+        for res in executor.map(post_export, tasks):
+            if isinstance(res, Exception):
+                print(f"task generated an exception: {res}")
+            else:
+                print("task returned: ", res.get("exportId", ""))
 
 
 def test_get_device_recordings_and_events(sora_cam_client, soracom_device):
     res = sora_cam_client.get_device_recordings_and_events(soracom_device)
-    logger.debug(f"device recordings and events: {res}")
+    logger.debug("device recordings and events: %s", res)
     assert len(res), "failed receive recordings and events"
 
 
@@ -190,14 +451,161 @@ def test_get_device_recordings_and_events_with_from_t(
     sora_cam_client, soracom_device
 ):
     from_t = _BEFOR_ONE_WEEK_FROM_T
-    to_t = int(time.time()) * 1000
+    to_t = _NOW_MS
     res = sora_cam_client.get_device_recordings_and_events(
         soracom_device, from_t=from_t, to_t=to_t, sort="desc"
     )
-    logger.debug(f"device recordings and events: {res}")
+    logger.debug("device recordings and events: %s", res)
     assert len(res), "failed receive recordings and events"
 
 
+@responses.activate
+def test_get_device_recordings_and_events_pages(stub_client):
+    _add_auth_response()
+    url = f"{stub_client._base_url}/d/recordings_and_events"
+    responses.add(
+        responses.GET,
+        url,
+        json=[{"type": "recording"}, {"type": "event"}],
+        headers={"x-soracom-next-key": "next"},
+    )
+    responses.add(responses.GET, url, json={"type": "event"})
+    res = stub_client.get_device_recordings_and_events("d")
+    assert res == [{"type": "recording"}, {"type": "event"}, {"type": "event"}]
+    assert "last_evaluated_key=next" in responses.calls[-1].request.url
+
+
+@responses.activate
+def test_download_file_from_url(tmp_path):
+    body = b"\xff\xd8\xff" + b"\0" * (sc.DOWNLOAD_CHUNK_SIZE + 1)
+    url = "https://example.com/exports/a%20b.jpg?X-Amz-Signature=s"
+    responses.add(responses.GET, url, body=body)
+    save_path = sc.SoraCamClient.download_file_from_url(url, tmp_path)
+    assert save_path == str(tmp_path / "a b.jpg")
+    assert (tmp_path / "a b.jpg").read_bytes() == body
+    with requests.Session() as session:
+        save_path = sc.SoraCamClient.download_file_from_url(
+            url, str(tmp_path), session
+        )
+    assert (tmp_path / "a b.jpg").read_bytes() == body
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/exports/..%2F..%2Fetc%2Fpasswd",
+        "https://example.com/exports/..",
+        "https://example.com/exports/",
+    ],
+)
+def test_negative_download_file_from_url_unsafe_name(tmp_path, url):
+    with pytest.raises(sc.SoraCamException):
+        sc.SoraCamClient.download_file_from_url(url, tmp_path)
+    assert not any(tmp_path.iterdir())
+
+
+@responses.activate
+def test_negative_download_file_from_url_http_error(tmp_path):
+    url = "https://example.com/exports/expired.jpg"
+    responses.add(responses.GET, url, status=403)
+    with pytest.raises(requests.exceptions.HTTPError):
+        sc.SoraCamClient.download_file_from_url(url, tmp_path)
+    assert not any(tmp_path.iterdir())
+
+
+def _slow_json_callback(delays):
+    # answers each URL after its delay, so the responses complete out of
+    # the order they were requested in
+    def callback(request):
+        key = request.path_url.split("?")[0].split("/")[-1]
+        time.sleep(delays.get(key, 0))
+        return 200, {}, json.dumps({"id": key})
+
+    return callback
+
+
+@responses.activate
+def test_get_device_bulk_order_and_errors(stub_client):
+    _add_auth_response()
+    delays = {"d1": 0.2, "d2": 0.1, "d3": 0}
+    responses.add_callback(
+        responses.GET,
+        re.compile(r".*/sora_cam/devices/d\d$"),
+        callback=_slow_json_callback(delays),
+    )
+    res = stub_client.get_device_bulk(["d1", "d2", "d3"], max_workers=3)
+    assert list(res.items()) == [
+        ("d1", {"id": "d1"}),
+        ("d2", {"id": "d2"}),
+        ("d3", {"id": "d3"}),
+    ]
+    urls = [f"{stub_client._base_url}/{dv}" for dv in ("d3", "d1", "d2")]
+    assert stub_client._get_many(urls, max_workers=3) == [
+        {"id": "d3"},
+        {"id": "d1"},
+        {"id": "d2"},
+    ]
+    responses.add(responses.GET, f"{stub_client._base_url}/bad", status=404)
+    with pytest.raises(requests.exceptions.HTTPError):
+        stub_client.get_device_bulk(["d1", "bad"], max_workers=2)
+
+
+@responses.activate
+def test_get_devices_events_bulk(stub_client):
+    _add_auth_response()
+    responses.add_callback(
+        responses.GET,
+        re.compile(r".*/sora_cam/devices/d\d/events"),
+        callback=lambda request: (
+            200,
+            {},
+            json.dumps([{"deviceId": request.path_url.split("/")[-2]}]),
+        ),
+    )
+    res = stub_client.get_devices_events_bulk(["d2", "d1"], limit=5)
+    assert res == {"d2": [{"deviceId": "d2"}], "d1": [{"deviceId": "d1"}]}
+    assert all("limit=5" in c.request.url for c in responses.calls[1:])
+    responses.add(
+        responses.GET, f"{stub_client._base_url}/bad/events", status=500
+    )
+    with pytest.raises(requests.exceptions.HTTPError):
+        stub_client.get_devices_events_bulk(["d1", "bad"])
+
+
+@responses.activate
+def test_check_exports_bulk(stub_client):
+    _add_auth_response()
+    for export_id in ("e1", "e2"):
+        responses.add(
+            responses.GET,
+            stub_client._export_url("d", "images", export_id),
+            json={"exportId": export_id, "status": "completed"},
+        )
+    res = stub_client.check_exports_bulk([("d", "e2"), ("d", "e1")], "images")
+    assert [r["exportId"] for r in res] == ["e2", "e1"]
+    responses.add(
+        responses.GET,
+        stub_client._export_url("d", "images", "e3"),
+        json={"status": "failed"},
+    )
+    with pytest.raises(sc.ExportFailedError):
+        stub_client.check_exports_bulk([("d", "e1"), ("d", "e3")], "images")
+
+
+@responses.activate
+def test_download_files_from_urls(stub_client, tmp_path):
+    urls = [f"https://example.com/exports/{n}.jpg" for n in range(3)]
+    for n, url in enumerate(urls):
+        responses.add(responses.GET, url, body=bytes([n]) * 10)
+    res = stub_client.download_files_from_urls(urls, tmp_path, max_workers=3)
+    assert res == [str(tmp_path / f"{n}.jpg") for n in range(3)]
+    assert [pathlib.Path(p).read_bytes()[0] for p in res] == [0, 1, 2]
+    expired = "https://example.com/exports/expired.jpg"
+    responses.add(responses.GET, expired, status=403)
+    with pytest.raises(requests.exceptions.HTTPError):
+        stub_client.download_files_from_urls([urls[0], expired], tmp_path)
+
+
 settings_test_cases = [
     ("logo", {"state": "off"}, {"state": "off"}),
     ("motion_tagging", {"state": "off"}, {"state": "off"}),
@@ -209,6 +617,9 @@ settings_test_cases = [
 ]
 
 
+# settings are device state shared by every test touching them, so they
+# run on one worker when the suite is distributed with --dist=loadgroup
+@pytest.mark.xdist_group("settings")
 @pytest.mark.parametrize(
     "setting, payload, expected_get_response", settings_test_cases
 )
@@ -223,9 +634,10 @@ def test_post_and_get_settings(
     ), f"Expected state {expected_get_response}, but got: {res}"
 
 
+@pytest.mark.xdist_group("settings")
 def test_get_settings_contains_keys(sora_cam_client, soracom_device):
     res = sora_cam_client.get_settings(device_id=soracom_device)
-    logger.debug(f"device settings: {res}")
+    logger.debug("device settings: %s", res)
     keys_to_check = [
         "logo",
         "motionTagging",